@@ -208,18 +208,19 @@ def allPossibleSelection(x, y):
         return None
 
     if len(x.columns) > 0:
-        combs = allCombinations(x.columns)
-        step_summary = pd.DataFrame()
+        combs = allCombinations(range(len(x.columns)))
+        # the design matrix is built once and every subset model fits on a column slice of it
+        design = np.column_stack([np.ones(len(x)), x.to_numpy(dtype=np.float64)])
+        target = np.asarray(y, dtype=np.float64)
+        rows = []
         for i in combs:
-            trainData = pd.DataFrame(x[list(i)])
-            trainData.insert(0, 'intercept', 1.0)
-            model = sm.OLS(y, trainData, missing='drop').fit()
+            model = sm.OLS(target, design[:, [0] + [j+1 for j in i]], missing='drop').fit()
             results = getModelResults(model)
-            step_summary = pd.concat([step_summary, 
-                                    pd.DataFrame([[str(list(i)).replace('[','').replace(']','').replace(', ', ' + ').replace("'",""), 
-                                                    results['AIC'], results['BIC'], results['R-squared'], 
-                                                    results['Adjusted R-sqaured'], results['Log-likelihood'],
-                                                    results['P-value']]])], ignore_index=True)
+            rows.append([' + '.join(str(x.columns[j]) for j in i), 
+                         results['AIC'], results['BIC'], results['R-squared'], 
+                         results['Adjusted R-sqaured'], results['Log-likelihood'],
+                         results['P-value']])
+        step_summary = pd.DataFrame(rows)
 
         step_summary.reset_index(inplace=True)
         step_summary.columns = ['Index', 'Predictors', 'AIC', 'BIC', 'R-squared', 'Adjusted R-sqaured',
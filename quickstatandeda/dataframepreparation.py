@@ -1,10 +1,86 @@
 import pandas as pd
 import numpy as np
+import scipy as sc
 
 def ifPivotable(df, index, column, value):
-    if df.groupby([index,column])[value].count().max() == 1:
+    if df.groupby([index,column], observed=True)[value].count().max() == 1:
         return True
     else:
         return False
 
 
+
+
+def andersonDarlingNormal(arr):
+    """Anderson-Darling test for normality on every column of a 2-D array at once
+
+    Mirrors scipy.stats.anderson(dist='norm') but sorts and reduces the whole
+    block in one pass instead of one call per column. NaNs are omitted per column.
+
+    Args:
+        arr (np.ndarray): 2-D array of shape (n_rows, n_features)
+
+    Returns:
+        tuple: statistics (n_features,), critical values (5, n_features) and significance levels (5,)
+    """
+    arr = np.asarray(arr, dtype=np.float64)
+    n = (~np.isnan(arr)).sum(axis=0)
+    w = (arr - np.nanmean(arr, axis=0)) / np.nanstd(arr, axis=0, ddof=1)
+    w = np.sort(w, axis=0)
+    logcdf = sc.stats.norm.logcdf(w)
+    logsf = sc.stats.norm.logsf(w)
+    k = np.arange(arr.shape[0])[:, None]
+    valid = k < n
+    rev = np.take_along_axis(logsf, np.clip(n - 1 - k, 0, None), axis=0)
+    terms = np.where(valid, (2*k + 1) / n * (logcdf + rev), 0.0)
+    statistic = -n - terms.sum(axis=0)
+    significance_level = np.array([15, 10, 5, 2.5, 1])
+    critical_values = np.around(np.array([0.576, 0.656, 0.787, 0.918, 1.092])[:, None] / (1.0 + 4.0/n - 25.0/n/n), 3)
+    return statistic, critical_values, significance_level
+
+
+def correlationMatrix(df):
+    """Pearson correlation matrix of numeric columns with pairwise complete observations
+
+    The pairwise counts and sums are computed with matrix products over the non-NaN
+    mask instead of looping over column pairs. Columns are centered on their mean first
+    so that large offsets (e.g. timestamps) do not cancel out in the sums.
+
+    Args:
+        df (pd.DataFrame): numeric features
+
+    Returns:
+        pd.DataFrame: correlation matrix, same as df.corr()
+    """
+    vals = df.to_numpy(dtype=np.float64)
+    mask = ~np.isnan(vals)
+    centered = np.where(mask, vals - np.nanmean(vals, axis=0), 0.0)
+    mask = mask.astype(np.float64)
+    n = mask.T @ mask
+    sum_x = centered.T @ mask
+    sum_xx = (centered**2).T @ mask
+    sum_xy = centered.T @ centered
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x*sum_x.T/n
+        var = sum_xx - sum_x**2/n
+        corr = cov / np.sqrt(var*var.T)
+    # a column that is constant on the overlap leaves only rounding error in var
+    var[var <= np.finfo(np.float64).eps * n * sum_xx] = 0.0
+    corr[(n < 1) | (var <= 0) | (var.T <= 0)] = np.nan
+    return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=df.columns, columns=df.columns)
+
+
+def normalQuantiles(n):
+    """Theoretical normal quantiles of a sample of size n, as used by scipy.stats.probplot
+
+    Args:
+        n (int): sample size
+
+    Returns:
+        np.ndarray: theoretical quantiles based on Filliben's order statistic medians
+    """
+    medians = np.empty(n, dtype=np.float64)
+    medians[-1] = 0.5**(1.0/n)
+    medians[0] = 1 - medians[-1]
+    medians[1:-1] = (np.arange(2, n) - 0.3175) / (n + 0.365)
+    return sc.stats.norm.ppf(medians)
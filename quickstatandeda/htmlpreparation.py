@@ -1,3 +1,7 @@
+import io
+import numpy as np
+from PIL import Image
+
 def findOutliers(df, col, ):
     """Find outlier records bsed on one column/feature
 
@@ -15,6 +19,64 @@ def findOutliers(df, col, ):
     records['modified_z_score'] = deviation_from_med/(0.6745*mad)
     return records[records['modified_z_score'].abs() > 3.5]
 
+def modifiedZScores(arr):
+    """Modified z-scores of every column of a 2-D array in one pass
+
+    Args:
+        arr (np.ndarray): 2-D array of shape (n_rows, n_features)
+
+    Returns:
+        np.ndarray: modified z-scores with the same shape as arr
+    """
+    median = np.nanmedian(arr, axis=0)
+    deviation_from_med = arr - median
+    mad = np.nanmedian(np.abs(deviation_from_med), axis=0)
+    return deviation_from_med/(0.6745*mad)
+
+def saveFigure(fig, path, dpi, executor, pending, max_pending=4):
+    """Rasterize a figure and save it as a PNG in the background
+
+    The figure is drawn on the calling thread because matplotlib artists are not
+    thread-safe; only the PNG encoding and the disk write are handed to the executor.
+    At most max_pending rasterized buffers are kept in flight, the oldest write is
+    waited on before a new figure is rasterized.
+
+    Args:
+        fig (matplotlib.figure.Figure): figure to save, closed once it is rasterized
+        path (str): output path of the PNG file
+        dpi (int): resolution of the PNG file
+        executor (concurrent.futures.Executor): executor that encodes and writes the PNG file
+        pending (list): futures of the PNG writes still in flight, updated in place
+        max_pending (int, optional): maximum number of PNG writes in flight. Defaults to 4.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    while len(pending) >= max_pending:
+        pending.pop(0).result()
+    fig.set_dpi(dpi)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    rgba = np.asarray(canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    pending.append(executor.submit(writePng, path, rgba, dpi))
+
+def writePng(path, rgba, dpi):
+    """Encode an RGBA buffer as a PNG in memory and write it to disk in one call
+
+    zlib level 1 is used instead of the default 6: the files are slightly larger
+    but encoding is several times faster.
+
+    Args:
+        path (str): output path of the PNG file
+        rgba (np.ndarray): image of shape (height, width, 4)
+        dpi (int): resolution stored in the PNG metadata
+    """
+    buf = io.BytesIO()
+    Image.fromarray(rgba).save(buf, format='png', compress_level=1, dpi=(dpi, dpi))
+    with open(path, 'wb') as f:
+        f.write(buf.getvalue())
+
 def saveInfoToHtml(sum_stats, visuals, regressions, save_path, file_name):
     """Generate an HTML file that showcases the exploratory data analysis
     
@@ -1,29 +1,23 @@
 import pandas as pd
 import numpy as np
 import scipy as sc
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
+import math
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from scipy.stats import ttest_ind, ttest_rel
 from scipy.stats import wilcoxon, mannwhitneyu
-from .autoregression import forwardSelection, backwardSelection, allPossibleSelection, findBestModels
-from .htmlpreparation import findOutliers, saveInfoToHtml
-from .dataframepreparation import ifPivotable
+from scipy.spatial.distance import pdist
+from scipy.cluster.hierarchy import linkage
+from .htmlpreparation import modifiedZScores, saveFigure, saveInfoToHtml
+from .dataframepreparation import ifPivotable, andersonDarlingNormal, correlationMatrix, normalQuantiles
 import warnings
 
-sns.set_style('white')
-sns.set_context("paper", 
-                rc={"font.size":8,
-                    "axes.titlesize":10,
-                    "axes.labelsize":8,
-                    'xtick.labelsize':6,
-                    'ytick.labelsize':6,
-                    'legend.fontsize':7})   
-
 def edaFeatures(x : pd.DataFrame, y : str = None, 
                 id : str =None, save_path : str = '', 
                 significant_level : float = 0.05, 
-                file_name : str = 'EDA', verbose = False):
+                file_name : str = 'EDA', verbose = False, 
+                dpi : int = 150):
     """Generate a HTML based exploratory data analysis report
 
     Args:
@@ -34,7 +28,22 @@ def edaFeatures(x : pd.DataFrame, y : str = None,
         significant_level (float, optional): significant level for t test. Defaults to 0.05.
         file_name (str, optional): file name of the HTML report. Defaults to 'EDA'.
         verbose(bool, optional): whether or not to print out the warnings
+        dpi (int, optional): resolution of the saved visuals. Defaults to 150.
     """
+    # plotting and regression libraries are only imported once a report is requested
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from .autoregression import forwardSelection, backwardSelection, allPossibleSelection, findBestModels
+
+    sns.set_style('white')
+    sns.set_context("paper", 
+                    rc={"font.size":8,
+                        "axes.titlesize":10,
+                        "axes.labelsize":8,
+                        'xtick.labelsize':6,
+                        'ytick.labelsize':6,
+                        'legend.fontsize':7})   
+
     # warning control
     if not verbose:
         warnings.filterwarnings('ignore')
@@ -66,6 +75,10 @@ def edaFeatures(x : pd.DataFrame, y : str = None,
     num_num = len(numeric_features)
     num_cat = len(categorical_features)
     num_datetime = len(datetime_features)
+    X_num = x[numeric_features]
+    X_cat = x[categorical_features]
+    X_num_arr = X_num.to_numpy(dtype=np.float64)
+    num_unique = X_num.nunique(dropna=True)
 
     sum_stats = {}
     visuals = {}
@@ -76,90 +89,84 @@ def edaFeatures(x : pd.DataFrame, y : str = None,
     print('Start preparing summary statistics ... ')
 
     if num_num > 0:
-        Shapiro_Wilk_results = []
-        Anderson_Darling_results = []
-        nan_count = []
-        datatypes = []
-        for i in numeric_features:
-            Shapiro_Wilk_results.append(sc.stats.shapiro(x[i], nan_policy='omit').pvalue)
-            ad_test = sc.stats.anderson(x[i][~np.isnan(x[i])])
-            if ad_test.statistic <= ad_test.critical_values[np.where(ad_test.significance_level==significant_level*100)[0][0]]:
-                ad_res = 'is from a normal distribution at ' + str(significant_level)
-            else:
-                ad_res = 'is not from a normal distribution at ' + str(significant_level)
-            Anderson_Darling_results.append(ad_res)
-            nan_count.append(x[i].isna().sum())
-            datatypes.append(str(x[i].dtype))
-
-        sum_stat_numeric = x[numeric_features].describe()
-        sum_stat_numeric.loc['number of nan'] = nan_count
-        sum_stat_numeric.loc['Shprio Wilk p value'] = Shapiro_Wilk_results
-        sum_stat_numeric.loc['Anderson Darling result'] = Anderson_Darling_results
-        sum_stat_numeric.loc['data type'] = datatypes
+        Shapiro_Wilk_results = sc.stats.shapiro(X_num_arr, axis=0, nan_policy='omit').pvalue.tolist()
+        ad_statistic, ad_critical_values, ad_significance_level = andersonDarlingNormal(X_num_arr)
+        ad_normal = ad_statistic <= ad_critical_values[np.where(ad_significance_level==significant_level*100)[0][0]]
+        Anderson_Darling_results = [('is from a normal distribution at ' if k else 'is not from a normal distribution at ') + str(significant_level)
+                                    for k in ad_normal]
+        nan_count = X_num.isna().sum().tolist()
+        datatypes = X_num.dtypes.astype(str).tolist()
+
+        sum_stat_numeric = X_num.describe()
+        sum_stat_numeric = pd.concat([sum_stat_numeric, pd.DataFrame([nan_count, Shapiro_Wilk_results, Anderson_Darling_results, datatypes],
+                                                      index=['number of nan', 'Shprio Wilk p value', 'Anderson Darling result', 'data type'],
+                                                      columns=numeric_features)])
         sum_stats['Numeric Features'] = sum_stat_numeric
         sum_stat_numeric.to_csv(save_path+'tables/sum_stat_numeric.csv', index=False)
 
     if num_cat > 0:
         unique_values = []
-        nan_count = []
-        datatypes = []
         for i in categorical_features:
-            unique_values.append(str(dict(x[i].value_counts())).replace('{','').replace('}',''))
-            nan_count.append(x[i].isna().sum())
-            datatypes.append(str(x[i].dtype))
-        sum_stat_categorical = x[categorical_features].describe()
-        sum_stat_categorical.loc['number of nan'] = nan_count
-        sum_stat_categorical.loc['unique values'] = unique_values
-        sum_stat_categorical.loc['data type'] = datatypes
+            vc = x[i].value_counts()
+            unique_values.append(', '.join(f'{k!r}: {v}' for k, v in vc.items()))
+        nan_count = X_cat.isna().sum().tolist()
+        datatypes = X_cat.dtypes.astype(str).tolist()
+        sum_stat_categorical = X_cat.describe()
+        sum_stat_categorical = pd.concat([sum_stat_categorical, pd.DataFrame([nan_count, unique_values, datatypes],
+                                                          index=['number of nan', 'unique values', 'data type'],
+                                                          columns=categorical_features)])
         sum_stats['Categorical Features'] = sum_stat_categorical
         sum_stat_categorical.to_csv(save_path+'tables/sum_stat_categorical.csv', index=False)
 
     if num_datetime > 0:
-        max_time = []
-        min_time = []
-        time_diff = []
-        datatypes = []
-        nan_count = []
-        for i in datetime_features:
-            max_time.append(max(x[i].dropna()))
-            min_time.append(min(x[i].dropna()))
-            time_diff.append(str(max(x[i].dropna())-min(x[i].dropna())))
-            nan_count.append(x[i].isna().sum())
-            datatypes.append(str(x[i].dtype))
-        sum_stat_datetime = x[datetime_features].astype(str).describe()[:2]
-        sum_stat_datetime.loc['latest date time'] = max_time
-        sum_stat_datetime.loc['earliest date time'] = min_time
-        sum_stat_datetime.loc['date time range'] = time_diff
-        sum_stat_datetime.loc['number of nan'] = nan_count
-        sum_stat_datetime.loc['data type'] = datatypes
+        X_dt = x[datetime_features]
+        time_range = X_dt.agg(['min','max'])
+        max_time = time_range.loc['max'].tolist()
+        min_time = time_range.loc['min'].tolist()
+        time_diff = [str(j-i) for i, j in zip(min_time, max_time)]
+        nan_count = X_dt.isna().sum().tolist()
+        datatypes = X_dt.dtypes.astype(str).tolist()
+        sum_stat_datetime = X_dt.astype(str).describe()[:2]
+        sum_stat_datetime = pd.concat([sum_stat_datetime, pd.DataFrame([max_time, min_time, time_diff, nan_count, datatypes],
+                                                       index=['latest date time', 'earliest date time', 'date time range', 'number of nan', 'data type'],
+                                                       columns=datetime_features)])
         sum_stats['Date Time Features'] = sum_stat_datetime
         sum_stat_datetime.to_csv(save_path+'tables/sum_stat_datetime.csv', index=False)
 
     # t test 
+    # integer-coded categoricals make the unique lookups, group masks and pivots below cheap
+    x_codes = x.copy(deep=False)
+    for i in categorical_features:
+        x_codes[i] = x_codes[i].astype('category').cat.remove_unused_categories()
+
     # paired
     if id != None:
-        paired_t_test_parametric = pd.DataFrame(columns=numeric_features)
-        paired_t_test_nonparametric = pd.DataFrame(columns=numeric_features)
+        paired_features = []
+        paired_para = []
+        paired_nonpara = []
         for i in categorical_features:
-            x_i_unique = x[i].unique()
-            if len(x_i_unique[~pd.isna(x_i_unique)]) == 2:
-                row_para = []
-                row_nonpara = []
+            if len(x_codes[i].cat.categories) == 2:
+                row_para = np.full(num_num, np.nan)
+                row_nonpara = np.full(num_num, np.nan)
                 add_row = False
-                for j in numeric_features:
-                    x_ij_unique = x[[id,i,j]].dropna()[i].unique()
-                    if len(x_ij_unique[~pd.isna(x_ij_unique)]) == 2 and ifPivotable( x[[id,i,j]].dropna(),id,i,j):
-                        tab_temp = x[[id,i,j]].dropna().pivot(index=id,columns=i,values=j).reset_index()
+                for m, j in enumerate(numeric_features):
+                    x_ij = x_codes[[id,i,j]].dropna()
+                    x_ij_unique = x_ij[i].unique()
+                    if len(x_ij_unique[~pd.isna(x_ij_unique)]) == 2 and ifPivotable(x_ij,id,i,j):
+                        tab_temp = x_ij.pivot(index=id,columns=i,values=j).reset_index()
                         if len(tab_temp.dropna()) > 0:
                             add_row = True
                             col_temp = tab_temp.columns
-                            row_para.append(ttest_rel(tab_temp[col_temp[1]], tab_temp[col_temp[2]],
-                                                    nan_policy = 'omit').pvalue)
-                            row_nonpara.append(wilcoxon(tab_temp[col_temp[1]], tab_temp[col_temp[2]],
-                                                        nan_policy = 'omit').pvalue)
+                            row_para[m] = ttest_rel(tab_temp[col_temp[1]], tab_temp[col_temp[2]],
+                                                    nan_policy = 'omit').pvalue
+                            row_nonpara[m] = wilcoxon(tab_temp[col_temp[1]], tab_temp[col_temp[2]],
+                                                      nan_policy = 'omit').pvalue
                 if add_row:
-                    paired_t_test_parametric.loc[i] = row_para
-                    paired_t_test_nonparametric.loc[i] = row_nonpara
+                    paired_features.append(i)
+                    paired_para.append(row_para)
+                    paired_nonpara.append(row_nonpara)
+        paired_t_test_parametric = pd.DataFrame(paired_para, index=paired_features, columns=numeric_features)
+        paired_t_test_nonparametric = pd.DataFrame(paired_nonpara, index=paired_features, columns=numeric_features)
         if len(paired_t_test_parametric) > 0:
             sum_stats['Parametric Paired T Test'] = paired_t_test_parametric
             paired_t_test_parametric.to_csv(save_path+'tables/paired_t_test_parametric.csv', index=False)
@@ -169,23 +176,17 @@ def edaFeatures(x : pd.DataFrame, y : str = None,
 
     #two-sample
     if len(categorical_features) > 0:
-        two_sample_t_test_parametric  = pd.DataFrame(columns=numeric_features)
-        two_sample_t_test_nonparametric = pd.DataFrame(columns=numeric_features)
-        for i in categorical_features:
-            x_i_unique = x[i].unique()
-            if len(x_i_unique[~pd.isna(x_i_unique)]) == 2:
-                row_para = []
-                row_nonpara = []
-                for j in numeric_features:
-                    unique_values = x_i_unique[~pd.isna(x_i_unique)]
-                    row_para.append(ttest_ind(x[x[i]==unique_values[0]][j], 
-                                            x[x[i]==unique_values[0]][j],
-                                            nan_policy = 'omit').pvalue)
-                    row_nonpara.append(mannwhitneyu(x[x[i]==unique_values[0]][j], 
-                                                    x[x[i]==unique_values[0]][j],
-                                                    nan_policy = 'omit').pvalue)
-                two_sample_t_test_parametric.loc[i] = row_para
-                two_sample_t_test_nonparametric.loc[i] = row_nonpara
+        binary_features = [i for i in categorical_features if len(x_codes[i].cat.categories) == 2]
+        two_sample_para = np.full((len(binary_features), num_num), np.nan)
+        two_sample_nonpara = np.full((len(binary_features), num_num), np.nan)
+        for c, i in enumerate(binary_features):
+            codes = x_codes[i].cat.codes.to_numpy()
+            a_block = X_num_arr[codes == 0]
+            b_block = X_num_arr[codes == 1]
+            two_sample_para[c, :] = ttest_ind(a_block, b_block, axis=0, nan_policy = 'omit').pvalue
+            two_sample_nonpara[c, :] = mannwhitneyu(a_block, b_block, axis=0, nan_policy = 'omit').pvalue
+        two_sample_t_test_parametric = pd.DataFrame(two_sample_para, index=binary_features, columns=numeric_features)
+        two_sample_t_test_nonparametric = pd.DataFrame(two_sample_nonpara, index=binary_features, columns=numeric_features)
         if len(two_sample_t_test_parametric) > 0:
             sum_stats['Parametric Two-Sample T Test'] = two_sample_t_test_parametric
             two_sample_t_test_parametric.to_csv(save_path+'tables/two_sample_t_test_parametric.csv', index=False)
@@ -199,211 +200,149 @@ def edaFeatures(x : pd.DataFrame, y : str = None,
     
     print('Start preparing visualizations ... ')
 
-    if num_num > 0:
-        corr_matrix = x[numeric_features].corr()
-        sns.heatmap(corr_matrix, annot=True, fmt=".2f", cmap="crest")
-        plt.savefig(save_path+'visuals/correlation_heatmap.png', dpi=500)
-        visuals['Heatmap of Correlation Matrix'] = 'correlation_heatmap.png'
-        plt.clf()
-        plt.close()
-
-    # outliers detection
-    for i in numeric_features:
-        if len(x[i].value_counts()) > 2:
-            outlierRecords = findOutliers(x, i)
-            if len(outlierRecords) > 0:
+    # figures are rendered here, PNG encoding and disk writes run in the background
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        save_futures = []
+
+        if num_num > 0:
+            corr_matrix = correlationMatrix(X_num)
+            # per-cell annotations are unreadable and costly to draw for wide matrices
+            fig, ax = plt.subplots()
+            sns.heatmap(corr_matrix, annot=num_num <= 30, fmt=".2f", cmap="crest", ax=ax)
+            saveFigure(fig, save_path+'visuals/correlation_heatmap.png', dpi, executor, save_futures)
+            visuals['Heatmap of Correlation Matrix'] = 'correlation_heatmap.png'
+
+        # outliers detection
+        modified_z_scores = modifiedZScores(X_num_arr)
+        outlier_mask = np.abs(modified_z_scores) > 3.5
+        for m, i in enumerate(numeric_features):
+            if num_unique[i] > 2 and outlier_mask[:, m].any():
+                outlierRecords = x[outlier_mask[:, m]].copy()
+                outlierRecords['modified_z_score'] = modified_z_scores[outlier_mask[:, m], m]
                 sum_stats['Outlier Records of Feature '+i] = outlierRecords
 
-    # missing value heatmap
-    sns.heatmap(x.isnull(), cbar=False)
-    plt.savefig(save_path+'visuals/missing_value_heatmap.png', dpi=500)
-    visuals['Heatmap of Missing Values'] = 'missing_value_heatmap.png'
-    plt.clf()
-    plt.close()
-
-    if num_num > 0:
-        # qq plot
-        for i in numeric_features:
-            if len(x[i].value_counts()) > 2:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                sc.stats.probplot(x[i], dist="norm", plot=ax, fit=False)
-                ax.get_lines()[0].set_markerfacecolor('black')  
-                ax.get_lines()[0].set_markeredgecolor('black') 
-
-                # Add 45-degree reference line
-                ax.plot([x[i].min(), x[i].max()], [x[i].min(), x[i].max()], 'k--', lw=2)
-
-                # Customize plot appearance
-                ax.set_xlabel('Theoretical Quantiles')
-                ax.set_ylabel('Sample Quantiles')
-
-                plt.savefig(save_path+'visuals/'+i+'_qqplot.png', dpi=500)
-                visuals['Q-Q Plot of Feature '+i] = i+'_qqplot.png'
-                plt.clf()
-                plt.close()
-
-        if num_datetime > 0:
-            # lineplot 
-            c = 0
-            h = 0
-            m = 0
-            ncol_per_row = 2
-            row_multiplier = num_datetime // ncol_per_row + 1
-            fig, axs = plt.subplots(num_num*row_multiplier, ncol_per_row, figsize=(10*ncol_per_row, 5*num_num*row_multiplier))
-            while c < num_num*row_multiplier and m < num_datetime:
-                if num_num*row_multiplier == 1:
-                    ax_temp = axs[h]
-                elif num_datetime == 1:
-                    ax_temp = axs[c,h]
-                else:
-                    ax_temp = axs[c,h]
-                sns.lineplot(data=x, x=datetime_features[m], 
-                                y=np.repeat(numeric_features,row_multiplier).tolist()[c], 
-                                color = '#49acf2', ax=ax_temp)
-                sns.scatterplot(data=x, x=datetime_features[m], 
-                                y=np.repeat(numeric_features,row_multiplier).tolist()[c], 
-                                color = '#ebac59', ax=ax_temp)
-                sns.despine(right = True)
-                if h < ncol_per_row-1:
-                    if m < num_datetime-1:
-                        h += 1
-                        m += 1
-                    elif m == num_datetime-1:
-                        m = 0
-                        h = 0
-                        c += 1
-                else:
-                    if m < num_datetime-1:
-                        h = 0
-                        c += 1
-                        m += 1
-                    elif m == num_datetime-1:
-                        m = 0
-                        h = 0
-                        c += 1
-            row = row_multiplier-1
-            col = num_datetime % ncol_per_row
-            while row < num_num*row_multiplier:
-                for i in range(col, ncol_per_row):
-                    if num_num*row_multiplier == 1:
-                        fig.delaxes(axs[i])
-                    else:
-                        fig.delaxes(axs[row,i])
-                row += row_multiplier
-            plt.savefig(save_path+'visuals/lineplot_all_numeric_vs_datetime.png', dpi=500)
-            visuals['Lineplot On All Numeric Features Paired with Date Time Features'] = 'lineplot_all_numeric_vs_datetime.png'
-            plt.clf()
-            plt.close()
-
-            # stacked barplot
-            for d in datetime_features:
-                fig, axs = plt.subplots(4, 1, figsize=(10,10*4))
-
-                for i in range(num_cat):
-                    df_grouped = x.groupby([d, categorical_features[i]]).size().unstack(fill_value=0)
-                    df_grouped.plot(kind='bar', stacked=True, ax=axs[i])
-                    axs[i].tick_params(axis='x', rotation=45)
-                    axs[i].set_ylabel(categorical_features[i])
-                    axs[i].set_xlabel('')
-                    axs[i].legend(loc='upper right')
-                
-                plt.savefig(save_path+'visuals/stacked_barplot_'+d+'.png', dpi=500)
-                visuals['Stacked Barplot On All Categorical Features Over '+d] = 'stacked_barplot_'+d+'.png'
-                plt.clf()
-                plt.close()
-
-        # clustermap
-        if num_num > 1:
-            sns.clustermap(x[numeric_features].dropna())
-            plt.savefig(save_path+'visuals/cluster_map.png', dpi=500)
-            visuals['Cluster Map On All Numeric Features'] = 'cluster_map.png'
-            plt.clf()
-            plt.close()
-
-        # pairplot
-        sns.pairplot(x[numeric_features], kind='reg',
-                    plot_kws={'line_kws':{'color':'#82ad32'},
-                            'scatter_kws': {'alpha': 0.5, 's':3,
-                                            'color': '#197805'}},
-                    diag_kws= {'color': '#82ad32'})
-        plt.savefig(save_path+'visuals/pairplot_numeric.png', dpi=500)
-        visuals['Pairplot On All Numeric Features'] = 'pairplot_numeric.png'
-        plt.clf()
-        plt.close()
-
-    if num_cat > 0:
-        # countplot
-        if num_cat > 1:
-            c = 0
-            h = 0
-            fig, axs = plt.subplots(num_cat,num_cat-1, figsize=(3*num_cat, 6*(num_cat-1)))
-            for ax in axs.flatten():
-                if c == h:
-                    h+=1
-                sns.countplot(data=x, x=categorical_features[c], 
-                            hue=categorical_features[h], ax=ax)
-                if h < num_cat-1:
-                    h += 1
-                else:
-                    h = 0
-                    c += 1 
-            plt.savefig(save_path+'visuals/countplot_categorical.png', dpi=500)
-        else:
-            sns.countplot(data=x, x=categorical_features[0])
-            plt.savefig(save_path+'visuals/countplot_categorical.png', dpi=500)
-        visuals['Countplot On All Categorical Features'] = 'countplot_categorical.png'
-        plt.clf()
-        plt.close()
-
-        # boxplot & stripplot
-        c = 0
-        h = 0
-        m = 0
-        ncol_per_row = 3
-        row_multiplier = num_num // ncol_per_row + 1
-        fig, axs = plt.subplots(num_cat*row_multiplier, ncol_per_row, figsize=(10*ncol_per_row, 10*num_cat*row_multiplier))
-        while c < num_cat*row_multiplier and m < num_num:
-            if num_cat*row_multiplier == 1:
-                ax_temp = axs[h]
-            elif num_num == 1:
-                ax_temp = axs[c,h]
-            else:
-                ax_temp = axs[c,h]                    
-            sns.boxplot(data=x, x=np.repeat(categorical_features,row_multiplier).tolist()[c], 
-                                    y=numeric_features[m], color = '#49acf2', ax=ax_temp)
-            sns.stripplot(data=x, x=np.repeat(categorical_features,row_multiplier).tolist()[c], 
-                                    y=numeric_features[m], color = '#ebac59', ax=ax_temp)
-            sns.despine(right = True)
-            if h < ncol_per_row-1:
-                if m < num_num-1:
-                    h += 1
-                    m += 1
-                elif m == num_num-1:
-                    h = 0
-                    m = 0
-                    c += 1
+        # missing value heatmap
+        fig, ax = plt.subplots()
+        sns.heatmap(x.isnull(), cbar=False, ax=ax)
+        saveFigure(fig, save_path+'visuals/missing_value_heatmap.png', dpi, executor, save_futures)
+        visuals['Heatmap of Missing Values'] = 'missing_value_heatmap.png'
+
+        if num_num > 0:
+            # qq plot
+            sorted_cols = np.sort(X_num_arr, axis=0)
+            non_nan_count = (~np.isnan(X_num_arr)).sum(axis=0)
+            theoretical_quantiles = {}
+            for m, i in enumerate(numeric_features):
+                if num_unique[i] > 2:
+                    n = non_nan_count[m]
+                    if n not in theoretical_quantiles:
+                        theoretical_quantiles[n] = normalQuantiles(n)
+                    sample_quantiles = sorted_cols[:n, m]
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    ax.plot(theoretical_quantiles[n], sample_quantiles, 'o', color='black')
+                    ax.set_title('Probability Plot')
+
+                    # Add 45-degree reference line
+                    ax.plot([sample_quantiles[0], sample_quantiles[-1]], [sample_quantiles[0], sample_quantiles[-1]], 'k--', lw=2)
+
+                    # Customize plot appearance
+                    ax.set_xlabel('Theoretical Quantiles')
+                    ax.set_ylabel('Sample Quantiles')
+
+                    saveFigure(fig, save_path+'visuals/'+i+'_qqplot.png', dpi, executor, save_futures)
+                    visuals['Q-Q Plot of Feature '+i] = i+'_qqplot.png'
+
+            if num_datetime > 0:
+                # lineplot 
+                ncol_per_row = 2
+                row_multiplier = math.ceil(num_datetime / ncol_per_row)
+                fig, axs = plt.subplots(num_num*row_multiplier, ncol_per_row, squeeze=False,
+                                        figsize=(10*ncol_per_row, 5*num_num*row_multiplier))
+                for (c, num), (m, dt) in itertools.product(enumerate(numeric_features), enumerate(datetime_features)):
+                    ax_temp = axs[c*row_multiplier + m // ncol_per_row, m % ncol_per_row]
+                    sns.lineplot(data=x, x=dt, y=num, color = '#49acf2', ax=ax_temp)
+                    sns.scatterplot(data=x, x=dt, y=num, color = '#ebac59', ax=ax_temp)
+                    sns.despine(ax=ax_temp, right = True)
+                for c, m in itertools.product(range(num_num), range(num_datetime, row_multiplier*ncol_per_row)):
+                    fig.delaxes(axs[c*row_multiplier + m // ncol_per_row, m % ncol_per_row])
+                saveFigure(fig, save_path+'visuals/lineplot_all_numeric_vs_datetime.png', dpi, executor, save_futures)
+                visuals['Lineplot On All Numeric Features Paired with Date Time Features'] = 'lineplot_all_numeric_vs_datetime.png'
+
+                # stacked barplot
+                for d in datetime_features:
+                    fig, axs = plt.subplots(4, 1, figsize=(10,10*4))
+
+                    for i in range(num_cat):
+                        df_grouped = x.groupby([d, categorical_features[i]]).size().unstack(fill_value=0)
+                        df_grouped.plot(kind='bar', stacked=True, ax=axs[i])
+                        axs[i].tick_params(axis='x', rotation=45)
+                        axs[i].set_ylabel(categorical_features[i])
+                        axs[i].set_xlabel('')
+                        axs[i].legend(loc='upper right')
+
+                    saveFigure(fig, save_path+'visuals/stacked_barplot_'+d+'.png', dpi, executor, save_futures)
+                    visuals['Stacked Barplot On All Categorical Features Over '+d] = 'stacked_barplot_'+d+'.png'
+
+            # clustermap
+            if num_num > 1:
+                # hierarchical clustering is quadratic in the number of rows, so large frames are subsampled
+                cluster_data = X_num.dropna()
+                if len(cluster_data) > 2000:
+                    cluster_data = cluster_data.sample(n=2000, random_state=0)
+                row_linkage = linkage(pdist(cluster_data.to_numpy(), metric='euclidean'), method='average')
+                col_linkage = linkage(pdist(cluster_data.to_numpy().T, metric='euclidean'), method='average')
+                g = sns.clustermap(cluster_data, row_linkage=row_linkage, col_linkage=col_linkage)
+                saveFigure(g.figure, save_path+'visuals/cluster_map.png', dpi, executor, save_futures)
+                visuals['Cluster Map On All Numeric Features'] = 'cluster_map.png'
+
+            # pairplot
+            # the grid is symmetric, so only the lower triangle is drawn and regplot skips the bootstrap confidence band
+            g = sns.PairGrid(X_num, diag_sharey=False, corner=True)
+            g.map_lower(sns.regplot, ci=None,
+                        line_kws={'color':'#82ad32'},
+                        scatter_kws={'alpha': 0.5, 's':3,
+                                     'color': '#197805'})
+            g.map_diag(sns.histplot, color='#82ad32')
+            saveFigure(g.figure, save_path+'visuals/pairplot_numeric.png', dpi, executor, save_futures)
+            visuals['Pairplot On All Numeric Features'] = 'pairplot_numeric.png'
+
+        if num_cat > 0:
+            # countplot
+            if num_cat > 1:
+                # countplot(x=i, hue=j) carries the same joint counts as (x=j, hue=i), so each pair is drawn once
+                cat_pairs = list(itertools.combinations(categorical_features, 2))
+                ncol_per_row = min(3, len(cat_pairs))
+                nrow = math.ceil(len(cat_pairs) / ncol_per_row)
+                fig, axs = plt.subplots(nrow, ncol_per_row, squeeze=False, figsize=(5*ncol_per_row, 5*nrow))
+                for ax, (c, h) in zip(axs.flat, cat_pairs):
+                    sns.countplot(data=x, x=c, hue=h, ax=ax)
+                for ax in axs.flat[len(cat_pairs):]:
+                    fig.delaxes(ax)
+                saveFigure(fig, save_path+'visuals/countplot_categorical.png', dpi, executor, save_futures)
             else:
-                if m < num_num-1:
-                    h = 0
-                    m += 1
-                    c += 1
-                elif m == num_num-1:
-                    h = 0
-                    m = 0
-                    c += 1
-        row = row_multiplier-1
-        col = num_num % ncol_per_row
-        while row < num_cat*row_multiplier:
-            for i in range(col, ncol_per_row):
-                if num_cat*row_multiplier == 1:
-                    fig.delaxes(axs[i])
-                else:
-                    fig.delaxes(axs[row,i])
-            row += row_multiplier
-        plt.savefig(save_path+'visuals/boxplot_all_numeric_vs_categorical.png', dpi=500)
-        visuals['Boxplot On All Categorical Features Paired with Numeric Features'] = 'boxplot_all_numeric_vs_categorical.png'
-        plt.clf()
-        plt.close()
+                fig, ax = plt.subplots()
+                sns.countplot(data=x, x=categorical_features[0], ax=ax)
+                saveFigure(fig, save_path+'visuals/countplot_categorical.png', dpi, executor, save_futures)
+            visuals['Countplot On All Categorical Features'] = 'countplot_categorical.png'
+
+            # boxplot & stripplot
+            if num_num > 0:
+                ncol_per_row = 3
+                row_multiplier = math.ceil(num_num / ncol_per_row)
+                fig, axs = plt.subplots(num_cat*row_multiplier, ncol_per_row, squeeze=False,
+                                        figsize=(10*ncol_per_row, 10*num_cat*row_multiplier))
+                for (c, cat), (m, num) in itertools.product(enumerate(categorical_features), enumerate(numeric_features)):
+                    ax_temp = axs[c*row_multiplier + m // ncol_per_row, m % ncol_per_row]
+                    sns.boxplot(data=x, x=cat, y=num, color = '#49acf2', ax=ax_temp)
+                    sns.stripplot(data=x, x=cat, y=num, color = '#ebac59', ax=ax_temp)
+                    sns.despine(ax=ax_temp, right = True)
+                for c, m in itertools.product(range(num_cat), range(num_num, row_multiplier*ncol_per_row)):
+                    fig.delaxes(axs[c*row_multiplier + m // ncol_per_row, m % ncol_per_row])
+                saveFigure(fig, save_path+'visuals/boxplot_all_numeric_vs_categorical.png', dpi, executor, save_futures)
+                visuals['Boxplot On All Categorical Features Paired with Numeric Features'] = 'boxplot_all_numeric_vs_categorical.png'
+
+        for future in save_futures:
+            future.result()
 
     print('Done preparing visualizations !')
     
@@ -412,10 +351,13 @@ def edaFeatures(x : pd.DataFrame, y : str = None,
     print('Start preparing auto regressions ... ')
 
     if y != None and x[y].dtype.name in num_dtypes:
-        target = x.dropna()[y]
-        forwardSelection_tab = forwardSelection(x.dropna()[numeric_features].copy().drop(columns=target.name),target)
-        backwardSelection_tab = backwardSelection(x.dropna()[numeric_features].copy().drop(columns=target.name),target)
-        allPossibleSelection_tab = allPossibleSelection(x.dropna()[numeric_features].copy().drop(columns=target.name), target)
+        x_complete = x.dropna()
+        target = x_complete[y]
+        predictors = x_complete[numeric_features].drop(columns=target.name)
+        forwardSelection_tab = forwardSelection(predictors, target)
+        # backwardSelection inserts an intercept column into its input
+        backwardSelection_tab = backwardSelection(predictors.copy(), target)
+        allPossibleSelection_tab = allPossibleSelection(predictors, target)
         if forwardSelection_tab is not None:
             regressions['Forward Selection'] = forwardSelection_tab
             forwardSelection_tab.to_csv(save_path+'tables/forwardSelection_tab.csv', index=False)
@@ -4,10 +4,13 @@ import pandas as pd
 import os
 import shutil
 import sys
+import scipy as sc
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from quickstatandeda import edaFeatures
+from quickstatandeda.dataframepreparation import andersonDarlingNormal, correlationMatrix, normalQuantiles
+from quickstatandeda.htmlpreparation import findOutliers, modifiedZScores
 
 def getData():
     sample_data = pd.DataFrame({
@@ -74,3 +77,84 @@ def test_quickstatandeda():
     except ValueError as e:
         pytest.fail(f"my_function raised an exception: {e}")
 
+
+def test_two_sample_t_test(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sample_data = pd.DataFrame({
+        'group': ['a']*10 + ['b']*10,
+        'value': list(range(10)) + list(range(100, 110))
+    })
+
+    edaFeatures(sample_data, save_path=str(tmp_path))
+
+    parametric = pd.read_csv(tmp_path / 'tables' / 'two_sample_t_test_parametric.csv')
+    nonparametric = pd.read_csv(tmp_path / 'tables' / 'two_sample_t_test_nonparametric.csv')
+    assert (parametric['value'] < 0.05).all()
+    assert (nonparametric['value'] < 0.05).all()
+
+def test_no_numeric_features(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sample_data = pd.DataFrame({
+        'id': [1, 1, 2, 2],
+        'cat1': ['a', 'b', 'a', 'b'],
+        'cat2': ['x', 'y', 'y', 'x']
+    })
+
+    edaFeatures(sample_data, id='id', save_path=str(tmp_path))
+
+    assert os.path.exists(tmp_path / 'EDA.html')
+
+def test_anderson_darling_normal():
+    rng = np.random.default_rng(0)
+    arr = np.column_stack([rng.normal(size=50), rng.exponential(size=50), rng.uniform(size=50)])
+    arr[[3, 17], 0] = np.nan
+    arr[10:30, 1] = np.nan
+
+    statistic, critical_values, significance_level = andersonDarlingNormal(arr)
+
+    for i in range(arr.shape[1]):
+        col = arr[:, i][~np.isnan(arr[:, i])]
+        expected = sc.stats.anderson(col)
+        assert np.isclose(statistic[i], expected.statistic)
+        assert np.allclose(critical_values[:, i], expected.critical_values)
+        assert np.array_equal(significance_level, expected.significance_level)
+
+def test_normal_quantiles():
+    for n in [1, 2, 7, 100]:
+        expected = sc.stats.probplot(np.arange(n), fit=False)[0]
+        assert np.allclose(normalQuantiles(n), expected)
+
+def test_modified_z_scores():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'a': rng.normal(size=60), 'b': rng.standard_t(2, size=60)})
+    df.loc[[0, 5], 'a'] = [15.0, np.nan]
+    df.loc[20:35, 'b'] = np.nan
+
+    scores = modifiedZScores(df.to_numpy(dtype='float64'))
+
+    for m, col in enumerate(df.columns):
+        expected = findOutliers(df, col)
+        mask = np.abs(scores[:, m]) > 3.5
+        assert df.index[mask].equals(expected.index)
+        assert np.allclose(scores[mask, m], expected['modified_z_score'])
+
+def test_correlation_matrix():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({'a': rng.normal(size=40), 'b': rng.normal(size=40),
+                       'timestamp': 1.6e9 + rng.normal(scale=100, size=40),
+                       'constant_on_overlap': rng.normal(size=40), 'single': np.nan})
+    df['b'] += df['a']
+    df.loc[[1, 8, 13, 30], 'a'] = np.nan
+    df.loc[[2, 8, 21], 'b'] = np.nan
+    df.loc[::5, 'timestamp'] = np.nan
+    # constant wherever 'a' is observed, varying only where 'a' is missing
+    df.loc[df['a'].notna(), 'constant_on_overlap'] = 3.0
+    df.loc[7, 'single'] = 1.0
+
+    result = correlationMatrix(df)
+    expected = df.corr()
+
+    assert result.index.equals(expected.index)
+    assert result.columns.equals(expected.columns)
+    assert np.array_equal(result.isna().to_numpy(), expected.isna().to_numpy())
+    assert np.allclose(result, expected, atol=1e-7, equal_nan=True)